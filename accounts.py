@@ -0,0 +1,134 @@
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+from gmail_client import GmailClient
+
+ACCOUNTS_FILE = os.getenv("GMAIL_ACCOUNTS_FILE", "accounts.json")
+
+#Shared LLM limits (across all accounts in this process)
+LLM_REQUESTS_PER_MINUTE = int(os.getenv("LLM_REQUESTS_PER_MINUTE", "60"))
+LLM_CACHE_SIZE = 1000
+
+class RateLimiter:
+    """Thread-safe token bucket shared by every account's GmailClient"""
+
+    def __init__(self, requests_per_minute: int):
+        self.rate = requests_per_minute / 60.0
+        self.capacity = max(1, requests_per_minute)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a request token is available"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+class LLMCache:
+    """Thread-safe LRU cache for LLM results shared across accounts"""
+
+    def __init__(self, max_size: int = LLM_CACHE_SIZE):
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            if key not in self.entries:
+                return None
+            self.entries.move_to_end(key)
+            return self.entries[key]
+
+    def set(self, key, value):
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            if len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+def load_accounts(path: str = ACCOUNTS_FILE) -> dict:
+    """Load account credentials from a JSON file
+
+    The file maps an account name to its OAuth files, e.g.
+    {"work": {"credentials_path": "credentials.json", "token_path": "tokens/work.json"}}
+
+    Args:
+        path: path to the accounts JSON file
+
+    Returns:
+        Dict of account name -> {'credentials_path': ..., 'token_path': ...}.
+        Falls back to a single 'default' account using credentials.json/token.json
+        when the file does not exist.
+    """
+    if not os.path.exists(path):
+        return {
+            'default': {
+                'credentials_path': 'credentials.json',
+                'token_path': 'token.json'
+            }
+        }
+    with open(path) as file:
+        raw = json.load(file)
+
+    accounts = {}
+    for name, config in raw.items():
+        accounts[name] = {
+            'credentials_path': config.get('credentials_path', 'credentials.json'),
+            'token_path': config.get('token_path', f"token_{name}.json")
+        }
+    if not accounts:
+        raise ValueError(f"No accounts configured in {path}")
+    return accounts
+
+class AccountPool:
+    def __init__(self, accounts: Optional[dict] = None):
+        """
+        Holds one GmailClient per account, all sharing a rate limiter and LLM cache
+
+        :param accounts: dict from load_accounts(), loaded from ACCOUNTS_FILE if omitted
+        :type accounts: dict
+        """
+        self.accounts = accounts if accounts is not None else load_accounts()
+        self.default_account = next(iter(self.accounts))
+        self.rate_limiter = RateLimiter(LLM_REQUESTS_PER_MINUTE)
+        self.cache = LLMCache()
+        self.clients = {}
+        self.lock = threading.Lock()
+
+    def names(self) -> list:
+        """Returns the configured account names"""
+        return list(self.accounts)
+
+    def get(self, account: Optional[str] = None) -> GmailClient:
+        """
+        Returns the GmailClient for an account, creating it on first use
+
+        :param account: account name, or None for the default (first) account
+        :type account: str
+        :return: the account's GmailClient
+        :rtype: GmailClient
+        """
+        name = account or self.default_account
+        if name not in self.accounts:
+            raise ValueError(f"Unknown account '{name}'. Available: {', '.join(self.accounts)}")
+        with self.lock:
+            if name not in self.clients:
+                config = self.accounts[name]
+                self.clients[name] = GmailClient(
+                    credentials_path=config['credentials_path'],
+                    token_path=config['token_path'],
+                    rate_limiter=self.rate_limiter,
+                    cache=self.cache
+                )
+            return self.clients[name]
@@ -1,6 +1,7 @@
 import time
 from gmail_client import GmailClient
 from datetime import datetime
+from typing import Optional
 from logger import log_action
 
 #Config
@@ -19,16 +20,13 @@ AUTO_REPLY_BLACKLIST = [
     'donotreply@',
 ]
 
-print("Email agent starting...")
-print(f"     Mode: {'DRY RUN' if DRY_RUN else 'LIVE'}")
-print(f"     Checking every {CHECK_INTERVAL} seconds\n\n")
-
-client = GmailClient()
-seen = set()
-
-def check_for_new_emails() -> list:
+def check_for_new_emails(client: GmailClient, seen: set) -> list:
     """PERCEIVE: Check for unread emails
 
+    Args:
+        client: GmailClient of the mailbox to check
+        seen: email IDs already handled for this mailbox
+
     Returns:
         A list of new email IDs that are new and unread
     """
@@ -36,10 +34,11 @@ def check_for_new_emails() -> list:
     unread_ids = [msg['id'] for msg in unread if msg['id'] not in seen]
     return unread_ids
 
-def decide_action(parsed_email: dict, classification: str) -> dict:
+def decide_action(client: GmailClient, parsed_email: dict, classification: str) -> dict:
     """DECIDE: What should we do with the email?
 
     Args:
+        client: GmailClient used to generate replies
         parsed_email: Parsed email with from, subject, body, etc
         classification: urgent', 'routine', 'spam', or 'personal'
         
@@ -97,16 +96,20 @@ def decide_action(parsed_email: dict, classification: str) -> dict:
                 'lassifcation'
             }
 
-def execute_action(action: dict, email: dict):
+def execute_action(client: GmailClient, action: dict, email: dict, account: Optional[str] = None):
     """ACT: Execute the decided action
 
     Args:
+        client: GmailClient of the mailbox the email belongs to
         action: dict specifying what action to take
         email: parsed email dict
+        account: account name, shown when running multiple mailboxes
     """
     action_type = action['type']
 
     print(f"\n Email from: {email['from']}")
+    if account:
+        print(f"    Account:{account}")
     print(f"    Subject:{email['subject']}")
     print(f"    Action:{action_type.upper()}")
 
@@ -165,47 +168,72 @@ def is_obvious_spam(parsed_email: dict) -> bool:
     
     return False
 
-while True:
-    try:
-        #PERCEIVE
-        new_emails = check_for_new_emails()
-
-        if new_emails:
-            print(f"Found {len(new_emails)} new email(s) \n")
-            for email_id in new_emails:
-                email = client.get_message(message_id=email_id)
-                parsed = client.parse_message(message=email)
-                sender = parsed['from']
-
-                if not any(allowed in sender for allowed in AUTO_REPLY_WHITELIST) and is_obvious_spam(parsed_email=parsed):
-                    action = {
-                            'type': 'spam',
-                            'reason': 'Classified by obvious spam detection'
-                        }
-                    log_action(parsed, 'spam', action)
-                    execute_action(
-                        action = action,
-                        email=parsed
-                    )
-                    continue
-
-
-                #DECIDE
-                classification = client.classify_email(parsed_email=parsed)
-                action = decide_action(parsed_email=parsed, classification=classification)
-
-                # LOG IT!
-                log_action(parsed, classification, action)
-
-                #EXECUTE
-                execute_action(action=action, email=parsed)
-                seen.add(email_id)
-        else:
-            print(f"[{datetime.now().strftime('%H:%M:%S')}] No new emails..")
-        time.sleep(CHECK_INTERVAL)
-    except KeyboardInterrupt:
-        print("\n\nAgent stopped by User")
-        break
-    except Exception as e:
-        print(f"Error: {e}")
-        time.sleep(CHECK_INTERVAL)
\ No newline at end of file
+def process_email(client: GmailClient, email_id: str, seen: set, account: Optional[str] = None):
+    """Run one email through DECIDE -> LOG -> EXECUTE
+
+    Args:
+        client: GmailClient of the mailbox the email belongs to
+        email_id: ID of the unread email
+        seen: email IDs already handled for this mailbox, updated in place
+        account: account name, recorded in logs when running multiple mailboxes
+    """
+    email = client.get_message(message_id=email_id)
+    parsed = client.parse_message(message=email)
+    sender = parsed['from']
+
+    if not any(allowed in sender for allowed in AUTO_REPLY_WHITELIST) and is_obvious_spam(parsed_email=parsed):
+        action = {
+                'type': 'spam',
+                'reason': 'Classified by obvious spam detection'
+            }
+        log_action(parsed, 'spam', action, account=account)
+        execute_action(
+            client=client,
+            action = action,
+            email=parsed,
+            account=account
+        )
+        seen.add(email_id)
+        return
+
+
+    #DECIDE
+    classification = client.classify_email(parsed_email=parsed)
+    action = decide_action(client=client, parsed_email=parsed, classification=classification)
+
+    # LOG IT!
+    log_action(parsed, classification, action, account=account)
+
+    #EXECUTE
+    execute_action(client=client, action=action, email=parsed, account=account)
+    seen.add(email_id)
+
+def main():
+    print("Email agent starting...")
+    print(f"     Mode: {'DRY RUN' if DRY_RUN else 'LIVE'}")
+    print(f"     Checking every {CHECK_INTERVAL} seconds\n\n")
+
+    client = GmailClient()
+    seen = set()
+
+    while True:
+        try:
+            #PERCEIVE
+            new_emails = check_for_new_emails(client, seen)
+
+            if new_emails:
+                print(f"Found {len(new_emails)} new email(s) \n")
+                for email_id in new_emails:
+                    process_email(client, email_id, seen)
+            else:
+                print(f"[{datetime.now().strftime('%H:%M:%S')}] No new emails..")
+            time.sleep(CHECK_INTERVAL)
+        except KeyboardInterrupt:
+            print("\n\nAgent stopped by User")
+            break
+        except Exception as e:
+            print(f"Error: {e}")
+            time.sleep(CHECK_INTERVAL)
+
+if __name__ == "__main__":
+    main()
@@ -24,7 +24,7 @@ class PotentialReplies(BaseModel):
     detailed: str = Field(description="Thorough, detailed reply")
 
 class GmailClient:
-    def __init__(self, credentials_path: str="credentials.json", token_path: str="token.json"):
+    def __init__(self, credentials_path: str="credentials.json", token_path: str="token.json", rate_limiter=None, cache=None):
         """
         Initialize Gmail Client with OAuth Credentials
         
@@ -33,10 +33,14 @@ class GmailClient:
         :type credentials_path: str
         :param token_path: path to save/load auth token
         :type token_path: str
+        :param rate_limiter: optional limiter with acquire(), shared across accounts for OpenAI calls
+        :param cache: optional cache with get()/set(), shared across accounts for classifications
 
         """
         self.credentials_path = credentials_path
         self.token_path = token_path
+        self.rate_limiter = rate_limiter
+        self.cache = cache
         creds = None
         if os.path.exists(token_path):
             creds = Credentials.from_authorized_user_file(token_path, SCOPES)
@@ -131,11 +135,22 @@ class GmailClient:
                 Preview: {parsed_email['snippet']}
 
                 Respond with just one word: urgent, personal, routine, or spam"""
+        # Same email landing in several mailboxes only gets classified once
+        cache_key = ('classify', parsed_email['from'], parsed_email['subject'], parsed_email['snippet'])
+        if self.cache is not None:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        self._rate_limit()
         response = client.responses.create(
             model="gpt-4o-mini",
             input=prompt
         )
-        return response.output_text.strip().lower()
+        classification = response.output_text.strip().lower()
+        if self.cache is not None:
+            self.cache.set(cache_key, classification)
+        return classification
 
     def generate_reply_suggestions(self, parsed_email: dict) -> list:
         """
@@ -154,6 +169,7 @@ class GmailClient:
             
             Return the response in a list
         """
+        self._rate_limit()
         response = client.responses.parse(
             model="gpt-4o-mini",
             input=prompt,
@@ -175,6 +191,7 @@ class GmailClient:
         Based on the sender and content, write a reply with the appropriate tone (casual, professional, or detailed).
         Keep it concise but helpful. Write ONLY the reply body text with appropriate tone. Start directly with the greeting."""
 
+        self._rate_limit()
         response = client.responses.create(
             model="gpt-4o-mini",
             input=prompt
@@ -201,6 +218,10 @@ class GmailClient:
         
         return send_message
     
+    def _rate_limit(self):
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+
     def _get_body(self, payload: dict) -> str:
         if 'body' in payload and 'data' in payload['body']:
             return self._decode_body(payload['body']['data'])
@@ -1,17 +1,19 @@
 import json
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
 
 LOG_DIR = Path('logs')
 LOG_DIR.mkdir(exist_ok=True)
 
-def log_action(email: dict, classification: str, action: dict):
+def log_action(email: dict, classification: str, action: dict, account: Optional[str] = None):
     """Save a record of what the agent did
     
     Args:
         email: Parsed email dict (with from, subject, etc.)
         classification: What AI said (urgent, routine, spam, personal)
         action: What agent decided to do (reply, archive, notify)
+        account: Account name when running multiple mailboxes
     """
     log_entry = {
         'timestamp: ': datetime.now().isoformat(),
@@ -21,6 +23,8 @@ def log_action(email: dict, classification: str, action: dict):
         'action_type': action.get('type'),
         'action_reason': action.get('reason')
     }
+    if account:
+        log_entry['account'] = account
 
     print(f"    [LOG] {classification} -> {action['type']}")
     today = datetime.now().strftime('%Y-%m-%d')
@@ -0,0 +1,100 @@
+import threading
+from collections import deque
+from datetime import datetime
+from accounts import AccountPool
+from agent import CHECK_INTERVAL, DRY_RUN, check_for_new_emails, process_email
+
+#Config
+NUM_WORKERS = 4
+#Max emails handled per account per polling cycle, so one busy mailbox can't hold up the rest
+MAX_EMAILS_PER_CYCLE = 20
+
+def shard_accounts(names: list, num_workers: int) -> list:
+    """Split account names across workers round-robin
+
+    Args:
+        names: all account names
+        num_workers: number of worker threads
+
+    Returns:
+        A list of non-empty account name lists, one per worker
+    """
+    shards = [names[i::num_workers] for i in range(num_workers)]
+    return [shard for shard in shards if shard]
+
+def run_shard(pool: AccountPool, names: list, stop: threading.Event):
+    """Worker loop for a shard of accounts
+
+    Each account is only ever touched by its own worker, so the per-account Gmail
+    service is never shared between threads. Within a cycle, emails are taken one
+    at a time from each account in turn (round-robin), capped at MAX_EMAILS_PER_CYCLE.
+
+    Args:
+        pool: shared AccountPool (OpenAI client, rate limiter and cache are shared)
+        names: account names owned by this worker
+        stop: event set to stop the worker
+    """
+    seen = {name: set() for name in names}
+
+    while not stop.is_set():
+        #PERCEIVE
+        queues = {}
+        for name in names:
+            try:
+                new_emails = check_for_new_emails(pool.get(name), seen[name])
+            except Exception as e:
+                print(f"[{name}] Error checking emails: {e}")
+                continue
+            if new_emails:
+                print(f"[{name}] Found {len(new_emails)} new email(s)")
+                queues[name] = deque(new_emails[:MAX_EMAILS_PER_CYCLE])
+
+        if not queues:
+            print(f"[{datetime.now().strftime('%H:%M:%S')}] No new emails for {', '.join(names)}..")
+
+        #DECIDE + ACT, fair round-robin across this shard's accounts
+        while queues and not stop.is_set():
+            for name in list(queues):
+                email_id = queues[name].popleft()
+                try:
+                    process_email(pool.get(name), email_id, seen[name], account=name)
+                except Exception as e:
+                    print(f"[{name}] Error processing {email_id}: {e}")
+                if not queues[name]:
+                    del queues[name]
+
+        stop.wait(CHECK_INTERVAL)
+
+def main():
+    pool = AccountPool()
+    names = pool.names()
+    shards = shard_accounts(names, NUM_WORKERS)
+
+    print("Multi-account email agent starting...")
+    print(f"     Mode: {'DRY RUN' if DRY_RUN else 'LIVE'}")
+    print(f"     Accounts: {', '.join(names)}")
+    print(f"     Workers: {len(shards)}")
+    print(f"     Checking every {CHECK_INTERVAL} seconds\n\n")
+
+    # Authenticate up front: the OAuth flow may open a browser, so don't do it from worker threads
+    for name in names:
+        pool.get(name)
+
+    stop = threading.Event()
+    workers = [
+        threading.Thread(target=run_shard, args=(pool, shard, stop), name=f"shard-{i}", daemon=True)
+        for i, shard in enumerate(shards)
+    ]
+    for worker in workers:
+        worker.start()
+
+    try:
+        while any(worker.is_alive() for worker in workers):
+            for worker in workers:
+                worker.join(timeout=1)
+    except KeyboardInterrupt:
+        print("\n\nAgent stopped by User")
+        stop.set()
+
+if __name__ == "__main__":
+    main()
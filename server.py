@@ -1,28 +1,49 @@
 from typing import Any, Optional
 import sys
 from mcp.server.fastmcp import FastMCP
-from gmail_client import GmailClient
+from accounts import AccountPool
 from pydantic import BaseModel, Field
 
 mcp = FastMCP("gmail_helper")
-gmail_client = GmailClient()
+accounts = AccountPool()
+# Authenticate every account up front so OAuth never runs mid-request
+for name in accounts.names():
+    accounts.get(name)
+
+ACCOUNT_FIELD_DESCRIPTION = "Account name to use (see gmail_list_accounts); defaults to the first configured account"
 
 class ListMessagesInput(BaseModel):
+    account: Optional[str] = Field(default=None, description=ACCOUNT_FIELD_DESCRIPTION)
     max_results: int = Field(default=10, gt=0, le=50, description="Maximum number of emails to return")
 
 class ReadEmailInput(BaseModel):
+    account: Optional[str] = Field(default=None, description=ACCOUNT_FIELD_DESCRIPTION)
     gmail_id: str = Field(min_length=1, description="Unique ID of an email")
 
 class SearchMessagesInput(BaseModel):
+    account: Optional[str] = Field(default=None, description=ACCOUNT_FIELD_DESCRIPTION)
     query: str = Field(default='', description="Gmail search query")
     max_results: int = Field(default=10, gt=0, le=50, description="Maximum number of emails to return")
 
 class SendEmailInput(BaseModel):
+    account: Optional[str] = Field(default=None, description=ACCOUNT_FIELD_DESCRIPTION)
     to: str = Field(description="Recipient email address")
     subject: str = Field(description="Email subject line")
     body: str = Field(description="Email body text")
     thread_id: Optional[str] = Field(default=None, description="Thread ID to reply to (optional)")
 
+@mcp.tool()
+async def gmail_list_accounts() -> str:
+    """List the Gmail accounts this server can access
+
+    Returns a formatted string of account names that can be passed as `account` to the other tools
+    """
+    output = f"# Accounts ({len(accounts.names())})\n\n"
+    for name in accounts.names():
+        default = " (default)" if name == accounts.default_account else ""
+        output += f"- `{name}`{default}\n"
+    return output
+
 @mcp.tool()
 async def gmail_list_messages(params: ListMessagesInput) -> str:
     """List recent Gmail messages with subject, sender, and preview
@@ -30,6 +51,10 @@ async def gmail_list_messages(params: ListMessagesInput) -> str:
     Returns a formatted string of emails with key details like who sent it, the id of the email,
     when it was sent, and a preview of the content
     """
+    try:
+        gmail_client = accounts.get(params.account)
+    except ValueError as e:
+        return str(e)
 
     recent_msgs = gmail_client.list_messages(params.max_results)
     
@@ -55,6 +80,10 @@ async def gmail_read_email(params: ReadEmailInput) -> str:
 
     Returns a formatted string of the email with sender, subject, body, and date
     """
+    try:
+        gmail_client = accounts.get(params.account)
+    except ValueError as e:
+        return str(e)
     email = gmail_client.get_message(params.gmail_id)
     parsed = gmail_client.parse_message(email)
 
@@ -72,6 +101,10 @@ async def gmail_search_messages(params: SearchMessagesInput) -> str:
     Returns a formatted string of emails that satisfy the query with the same format
     as gmail_list_messages. Supports queries like 'from:email@example.com', 'subject:meeting'
     """
+    try:
+        gmail_client = accounts.get(params.account)
+    except ValueError as e:
+        return str(e)
     msgs = gmail_client.list_messages(params.max_results, params.query)
 
     if not msgs:
@@ -97,6 +130,10 @@ async def gmail_suggest_reply(params: ReadEmailInput) -> str:
     Returns a formatted string of three suggestions with different tones: casual, professional
     and detailed
     """
+    try:
+        gmail_client = accounts.get(params.account)
+    except ValueError as e:
+        return str(e)
     email = gmail_client.get_message(params.gmail_id)
     parsed = gmail_client.parse_message(email)
     
@@ -118,6 +155,10 @@ async def gmail_send_email(params: SendEmailInput) -> str:
 
     Can send a new email or reply to an existing conversaion by providing thread_id
     """
+    try:
+        gmail_client = accounts.get(params.account)
+    except ValueError as e:
+        return str(e)
     sent = gmail_client.send_email(
         to=params.to, 
         subject=params.subject, 